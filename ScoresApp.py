@@ -1,12 +1,83 @@
 import requests
-from datetime import datetime
-import pytz
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from datetime import datetime, timezone
+from zoneinfo import ZoneInfo
 import logging
+import time
+import queue
+import threading
 import tkinter as tk
 from tkinter import ttk, messagebox
-import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from dataclasses import dataclass
+
+# One game from a scoreboard - slots keep these small since a busy day has a lot of them
+@dataclass(slots=True)
+class Game:
+    game_id: str
+    date: str
+    time: str
+    status: str
+    home_team: str
+    away_team: str
+    home_score: str
+    away_score: str
 
 class ScoreFetcher:
+    # Time zones looked up once and shared - Eastern Time ( Boston ) is my current location
+    _ET = ZoneInfo("America/New_York")
+    _UTC = timezone.utc
+
+    # Parses ESPN's fixed-width "YYYY-MM-DDTHH:MMZ" timestamps by slicing - much cheaper than strptime
+    @staticmethod
+    def _parse_espn_dt(s):
+        return datetime(int(s[0:4]), int(s[5:7]), int(s[8:10]), int(s[11:13]), int(s[14:16]),
+                        tzinfo=ScoreFetcher._UTC)
+
+    # Turns one ESPN event into a Game, or None if the game can't be used
+    # This runs for every event, so the default arguments bind the helpers as fast local names
+    @staticmethod
+    def _to_game(event, _parse=_parse_espn_dt, _ET=_ET, _astimezone=datetime.astimezone,
+                 _strftime=datetime.strftime):
+        try:
+            # Parse the UTC kickoff once and convert it to Eastern Time for both date and time
+            et_time = _astimezone(_parse(event['date']), _ET)
+            status = event['status']['type']['shortDetail']
+
+            # ensures there is competition data
+            competitions = event.get('competitions')
+            if not competitions:
+                return None
+
+            competitors = competitions[0].get('competitors', [])
+            if len(competitors) != 2:
+                return None
+
+            # There are exactly two competitors, so one check tells us which is home and which is away
+            home_team, away_team = competitors
+            if home_team['homeAway'] != 'home':
+                home_team, away_team = away_team, home_team
+
+            return Game(
+                game_id=event['id'],
+                date=_strftime(et_time, "%Y-%m-%d"),
+                time=_strftime(et_time, "%I:%M %p ET"),
+                # Simplify the status - Final, Scheduled, or Live
+                status="Final" if status == "Final" else "Scheduled" if " - " in status else "Live",
+                home_team=home_team['team']['displayName'],
+                away_team=away_team['team']['displayName'],
+                home_score=home_team.get('score', 'N/A'),  # Use N/A if score is missing
+                away_score=away_team.get('score', 'N/A'),
+            )
+
+        # Error message if something went wrong while parsing a game
+        except (KeyError, ValueError, TypeError) as e:
+            logging.error(f"Error processing game {event.get('id', 'unknown')}: {e}. Skipping!")
+            return None
+
     def __init__(self):
         # Set up logging to keep track of what's going on
         logging.basicConfig(filename='score_fetcher.log', level=logging.INFO,
@@ -16,24 +87,6 @@ class ScoreFetcher:
         self.espn_base_url = "https://www.espn.com"
         self.api_base_url = "https://site.api.espn.com/apis/site/v2/sports"
         
-        # List of leagues mapped to their specific fetch methods
-        self.supported_leagues = {
-            "nfl": self.get_nfl_scores,
-            "nba": self.get_nba_scores,
-            "mlb": self.get_mlb_scores,
-            "nhl": self.get_nhl_scores,
-            "mls": self.get_mls_scores,
-            "premier-league": self.get_premier_league_scores,
-            "la-liga": self.get_la_liga_scores,
-            "bundesliga": self.get_bundesliga_scores,
-            "serie-a": self.get_serie_a_scores,
-            "ligue-1": self.get_ligue_1_scores,
-            "uefa-champions": self.get_uefa_champions_scores,
-            "uefa-europa": self.get_uefa_europa_scores,
-            "ncaa-football": self.get_ncaa_football_scores,
-            "ncaa-mens-basketball": self.get_ncaa_mens_basketball_scores,
-        }
-        
         # Mapping of league names to their API paths
         self.league_paths = {
             "nfl": "football/nfl",
@@ -52,19 +105,53 @@ class ScoreFetcher:
             "ncaa-mens-basketball": "basketball/mens-college-basketball",
         }
 
+        # Supported leagues are just the ones we have an API path for
+        self.supported_leagues = self.league_paths
+
         # Headers to trick the API into thinking we're a browser
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
             'Accept': 'application/json',
         }
 
+        # (connect, read) timeouts in seconds so a stalled request can't hang forever
+        self.timeout = (3.05, 10)
+        self.box_score_timeout = (3.05, 15)  # Box scores are much bigger payloads
+
+        # One shared session so connections to ESPN get reused (keep-alive) instead of
+        # doing a fresh TCP + TLS handshake on every fetch
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retries = Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        self.session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=10, max_retries=retries))
+
+        # In-memory cache of parsed responses: key -> (expires_at, value)
+        # Live games go stale fast, finished games never change
+        # The lock is needed because fetches run on several worker threads at once
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+        self.cache_size = 128
+        self.live_ttl = 15
+        self.final_ttl = 86400
+        self.default_ttl = 300
+
+        # ETags from ESPN plus the games we parsed from that response, keyed like the cache
+        # so a refresh can ask "has this changed?" and get a tiny 304 back when it hasn't
+        # These are only set through _cache_put and get evicted with the cache, so they share its size limit
+        self._etags = {}
+        self._last_payload = {}
+
+        # Worker threads for fetching several leagues at once - they all share the pooled session
+        self._pool = ThreadPoolExecutor(max_workers=8)
+
     # Fetches scores for a given league
     def get_scores(self, league, date_str=None):
         # Make sure the league name is lowercase to avoid case issues
         league = league.lower()
         
         # Check if the league is supported
-        if league not in self.supported_leagues:
+        path = self.league_paths.get(league)
+        if path is None:
             return "league_not_supported"
 
         try:
@@ -72,11 +159,11 @@ class ScoreFetcher:
             if date_str:
                 date_obj = datetime.strptime(date_str, "%Y%m%d")
             else:
-                date_obj = datetime.now(pytz.timezone('America/New_York'))
+                date_obj = datetime.now(self._ET)
                 date_str = date_obj.strftime("%Y%m%d")
 
-            # Call the appropriate league-specific method
-            return self.supported_leagues[league](date_str)
+            # Fetch the scoreboard for that league's API path
+            return self._espn_api_fetch(path, date_str)
         
         # If the date format is wrong return a ValueError
         except ValueError:
@@ -90,98 +177,134 @@ class ScoreFetcher:
         except Exception as e:
             return "unexpected_error", str(e)
 
+    # Fetches scores for every supported league at once, returns {league: games}
+    def get_all_scores(self, date_str):
+        futures = {league: self._pool.submit(self._espn_api_fetch, path, date_str)
+                   for league, path in self.league_paths.items()}
+        results = {}
+        for league, future in futures.items():
+            try:
+                results[league] = future.result()
+            except Exception as e:
+                # One bad league shouldn't sink the rest
+                logging.error(f"Error fetching scores for {league}: {e}")
+                results[league] = []
+        return results
+
+    # Returns the cached value for key if it hasn't expired yet, otherwise None
+    def _cache_get(self, key):
+        with self._cache_lock:
+            entry = self._cache.get(key)
+        if entry is not None and time.monotonic() < entry[0]:
+            return entry[1]
+        return None
+
+    # Stores value in the cache for ttl seconds, dropping expired (then oldest) entries when full
+    # If an etag is given it's remembered with the value for conditional requests (see _espn_api_fetch)
+    def _cache_put(self, key, value, ttl, etag=None):
+        now = time.monotonic()
+        with self._cache_lock:
+            if len(self._cache) >= self.cache_size:
+                for old_key in [k for k, (expires_at, _) in self._cache.items() if expires_at <= now]:
+                    self._cache_evict(old_key)
+                while len(self._cache) >= self.cache_size:
+                    self._cache_evict(next(iter(self._cache)))
+            self._cache[key] = (now + ttl, value)
+            if etag:
+                self._etags[key] = etag
+                self._last_payload[key] = value
+
+    # Drops a key from the cache along with its ETag - caller must hold _cache_lock
+    def _cache_evict(self, key):
+        del self._cache[key]
+        self._etags.pop(key, None)
+        self._last_payload.pop(key, None)
+
+    # Returns (etag, games) from the last full response for key, or (None, None)
+    def _conditional_get(self, key):
+        with self._cache_lock:
+            if key in self._etags:
+                return self._etags[key], self._last_payload[key]
+        return None, None
+
     # The API fetching - this method gets the game data
     def _espn_api_fetch(self, league_url_part, date_str):
+        # Serve from the cache if we fetched this scoreboard recently
+        cache_key = (league_url_part, date_str)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logging.info(f"Using cached scores for {league_url_part} on {date_str}")
+            return cached
+
         # Build the API URL
         api_url = f"{self.api_base_url}/{league_url_part}/scoreboard?dates={date_str}"
-        games = []  # Store all the game data in a list
 
-        
         logging.info(f"Fetching scores for {league_url_part} on {date_str} from {api_url}")
 
+        # Send the ETag from last time so ESPN can answer 304 Not Modified
+        headers = {}
+        etag, last_games = self._conditional_get(cache_key)
+        if etag:
+            headers['If-None-Match'] = etag
+
         try:
             # Make the API call
-            response = requests.get(api_url, headers=self.headers)
+            response = self.session.get(api_url, headers=headers, timeout=self.timeout)
             response.raise_for_status()  # If the request fails, throw an exception
-            data = response.json()
+
+            # Nothing changed since last time - reuse the games we already parsed
+            if response.status_code == 304:
+                logging.info(f"Scores for {league_url_part} on {date_str} not modified - reusing them")
+                self._cache_put(cache_key, last_games, self._scoreboard_ttl(last_games), etag=etag)
+                return last_games
+
+            data = orjson.loads(response.content)
 
             # The list of events (games) from the response
             events = data.get('events', [])
             if not events:
                 logging.info("No games found for this date - bummer!")
-                return []
 
-            # Loop through each game and extract
-            for event in events:
-                try:
-                    game = {}  # Each game gets its a dictionary 
-                    game['game_id'] = event['id']
-                    game['date'] = datetime.strptime(event['date'], "%Y-%m-%dT%H:%MZ").strftime("%Y-%m-%d")
-                    
-                    # Convert the UTC time to Eastern Time( Boston ) my current location
-                    time_str = event.get('date')
-                    try:
-                        utc_time = datetime.strptime(time_str, "%Y-%m-%dT%H:%MZ").replace(tzinfo=pytz.UTC)
-                        et_time = utc_time.astimezone(pytz.timezone('America/New_York'))
-                        game['time'] = et_time.strftime("%I:%M %p ET")
-                    except ValueError:
-                        game['time'] = ""  # If the time parsing fails, leave it blank
-
-                    game['status'] = event['status']['type']['shortDetail']
-
-                    # ensures there is competition data
-                    competitions = event.get('competitions', [])
-                    if not competitions:
-                        continue
+            # Turn each event into a game, skipping the ones we can't use
+            to_game = self._to_game
+            games = [game for event in events if (game := to_game(event)) is not None]
 
-                    competition = competitions[0]
-                    competitors = competition.get('competitors', [])
-                    if len(competitors) != 2: 
-                        continue
-
-                    # Find the home and away teams - using next()
-                    home_team = next((team for team in competitors if team['homeAway'] == 'home'), None)
-                    away_team = next((team for team in competitors if team['homeAway'] == 'away'), None)
-
-                    if home_team and away_team:
-                        game['home_team'] = home_team['team']['displayName']
-                        game['away_team'] = away_team['team']['displayName']
-                        game['home_score'] = home_team.get('score', 'N/A')  # Use N/A if score is missing
-                        game['away_score'] = away_team.get('score', 'N/A')  # Use N/A if score is missing
-
-                        # Simplify the status - Final, Scheduled, or Live
-                        if game['status'] == "Final":
-                            game['status'] = "Final"
-                        elif " - " in game['status']:
-                            game['status'] = "Scheduled"
-                        else:
-                            game['status'] = "Live"
-
-                    games.append(game)
-
-                # Error message if something went wrong while parsing a game
-                except (KeyError, ValueError, TypeError) as e:
-                    logging.error(f"Error processing game {event.get('id', 'unknown')}: {e}. Skipping!")
-                    continue
-
-        # Network error message
-        except requests.exceptions.RequestException as e:
+        # Network error message (or a response that wasn't valid JSON)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
             logging.error(f"API request failed: {e}")
             return []
 
+        # Remember the ETag so the next fetch of this scoreboard can be a conditional request
+        self._cache_put(cache_key, games, self._scoreboard_ttl(games), etag=response.headers.get('ETag'))
+
         return games
+
+    # How long a scoreboard stays cached - live games expire quickly, a day that's all final can stay cached
+    def _scoreboard_ttl(self, games):
+        statuses = [game.status for game in games]
+        if "Live" in statuses:
+            return self.live_ttl
+        if statuses and all(status == "Final" for status in statuses):
+            return self.final_ttl
+        return self.default_ttl
     
     # Method to fetch the box score for a specific game
     def get_game_box_score(self, league_url_part, game_id):
+        # Serve from the cache if we've already got this box score
+        cache_key = ("box_score", game_id)
+        cached = self._cache_get(cache_key)
+        if cached is not None:
+            logging.info(f"Using cached box score for game {game_id}")
+            return cached
+
         # Build the URL for the box score API
         api_url = f"{self.api_base_url}/{league_url_part}/summary?event={game_id}"
         logging.info(f"Fetching box score for game {game_id} from {api_url}")
 
         try:
-            
-            response = requests.get(api_url, headers=self.headers)
+            response = self.session.get(api_url, timeout=self.box_score_timeout)
             response.raise_for_status()
-            data = response.json()
+            data = orjson.loads(response.content)
             
             # Set up a dictionary to hold all the box score information
             box_score = {
@@ -191,7 +314,8 @@ class ScoreFetcher:
             }
             
             # Extract team info - who played, their scores, and if they were home or away
-            for team in data.get('header', {}).get('competitions', [{}])[0].get('competitors', []):
+            competition = data.get('header', {}).get('competitions', [{}])[0]
+            for team in competition.get('competitors', []):
                 team_info = {
                     'name': team['team']['displayName'],
                     'score': team.get('score', 'N/A'),
@@ -211,9 +335,17 @@ class ScoreFetcher:
             for team in players_data:
                 team_name = team['team']['displayName']
                 stats = team.get('statistics', [])
-                logging.info(f"Player stats structure for {team_name}: {json.dumps(stats, indent=2)}")
+                # Dumping the whole stats tree is expensive, so only do it when debugging
+                if logging.getLogger().isEnabledFor(logging.DEBUG):
+                    logging.debug("Player stats structure for %s: %s", team_name,
+                                  orjson.dumps(stats, option=orjson.OPT_INDENT_2).decode())
                 box_score['player_stats'][team_name] = stats
 
+            # A finished game's box score won't change anymore, so keep it for the day
+            finished = competition.get('status', {}).get('type', {}).get('state') == 'post'
+            has_scores = box_score['teams'] and all(team['score'] != 'N/A' for team in box_score['teams'])
+            self._cache_put(cache_key, box_score, self.final_ttl if finished and has_scores else self.live_ttl)
+
             return box_score
 
         # Return an error message if network errors
@@ -226,52 +358,12 @@ class ScoreFetcher:
             logging.error(f"Error processing box score: {e}")
             return "unexpected_error", str(e)
 
-    # League specific methods
-    # TODO: Refactor to use league_paths dict
-    def get_nfl_scores(self, date_str):
-        return self._espn_api_fetch("football/nfl", date_str)
-
-    def get_nba_scores(self, date_str):
-        return self._espn_api_fetch("basketball/nba", date_str)
-
-    def get_mlb_scores(self, date_str):
-        return self._espn_api_fetch("baseball/mlb", date_str)
-
-    def get_nhl_scores(self, date_str):
-        return self._espn_api_fetch("hockey/nhl", date_str)
-
-    def get_mls_scores(self, date_str):
-        return self._espn_api_fetch("soccer/usa.1", date_str)
-
-    def get_premier_league_scores(self, date_str):
-        return self._espn_api_fetch("soccer/eng.1", date_str)
-
-    def get_la_liga_scores(self, date_str):
-        return self._espn_api_fetch("soccer/esp.1", date_str)
-
-    def get_bundesliga_scores(self, date_str):
-        return self._espn_api_fetch("soccer/ger.1", date_str)
-
-    def get_serie_a_scores(self, date_str):
-        return self._espn_api_fetch("soccer/ita.1", date_str)
-
-    def get_ligue_1_scores(self, date_str):
-        return self._espn_api_fetch("soccer/fra.1", date_str)
-
-    def get_uefa_champions_scores(self, date_str):
-        return self._espn_api_fetch("soccer/uefa.champions", date_str)
-
-    def get_uefa_europa_scores(self, date_str):
-        return self._espn_api_fetch("soccer/uefa.europa", date_str)
-
-    def get_ncaa_football_scores(self, date_str):
-        return self._espn_api_fetch("football/college-football", date_str)
-
-    def get_ncaa_mens_basketball_scores(self, date_str):
-        return self._espn_api_fetch("basketball/mens-college-basketball", date_str)
-
 # GUI - allows for the user to interact with the app
 class ScoreApp:
+    # Team stats table layout - the same for every team, so it's only set up once
+    TEAM_STATS_COLUMNS = (("stat", "Statistic"), ("value", "Value"))
+    TEAM_STATS_WIDTHS = (200, 150)
+
     def __init__(self, master):
         self.master = master
         master.title("Sports Score App")
@@ -281,6 +373,23 @@ class ScoreApp:
         # ScoreFetcher backend instance 
         self.fetcher = ScoreFetcher()
 
+        # Worker threads for the network calls so the window doesn't freeze while we wait on ESPN
+        self.executor = ThreadPoolExecutor(max_workers=4)
+
+        # Finished background jobs wait here until the Tk thread picks them up in _poll_results,
+        # so worker threads never touch Tk themselves
+        self._finished = queue.Queue()
+        self.poll_interval_ms = 50
+
+        # Latest request number per channel (e.g. "scores") - results from older requests are dropped
+        self._request_count = 0
+        self._latest_request = {}
+
+        # Auto refresh - the pending after() job and whichever fetch the user ran last
+        self._refresh_job = None
+        self._refresh_command = None
+        self._last_interval_ms = None  # Reused when an auto refresh fails, so one hiccup doesn't stop polling
+
         # GUI styling
         style = ttk.Style()
         style.theme_use('clam') 
@@ -294,6 +403,9 @@ class ScoreApp:
         # Builds the UI
         self.create_widgets()
 
+        # Start picking up background results
+        self.master.after(self.poll_interval_ms, self._poll_results)
+
     # Method that sets up the widgets in the GUI
     def create_widgets(self):
         main_frame = ttk.Frame(self.master, padding="10 10 10 10")
@@ -308,7 +420,7 @@ class ScoreApp:
 
         self.league_var = tk.StringVar()
         self.league_combo = ttk.Combobox(league_frame, textvariable=self.league_var,
-                                         values=list(self.fetcher.supported_leagues.keys()))
+                                         values=list(self.fetcher.league_paths.keys()))
         self.league_combo.pack(side=tk.LEFT, padx=5, fill=tk.X, expand=True)
         self.league_combo.set("nba")  # Default to NBA - Lets Go CELTICS!!!!!
 
@@ -322,8 +434,7 @@ class ScoreApp:
         self.date_var = tk.StringVar()
         self.date_entry = ttk.Entry(date_frame, textvariable=self.date_var, width=12)
         self.date_entry.pack(side=tk.LEFT, padx=5)
-        boston_tz = pytz.timezone('America/New_York')
-        self.date_var.set(datetime.now(boston_tz).strftime("%Y-%m-%d"))  # Default to today in Eastern time zone
+        self.date_var.set(datetime.now(self.fetcher._ET).strftime("%Y-%m-%d"))  # Default to today in Eastern time zone
 
         # Filter frame
         filter_frame = ttk.LabelFrame(main_frame, text="Filter Options", padding="10")
@@ -362,11 +473,19 @@ class ScoreApp:
         self.refresh_button = ttk.Button(button_frame, text="Refresh Scores", command=self.fetch_and_display)
         self.refresh_button.pack(side=tk.LEFT, padx=5)  # Refresh scores
 
+        self.fetch_all_button = ttk.Button(button_frame, text="Fetch All", command=self.fetch_all_and_display)
+        self.fetch_all_button.pack(side=tk.LEFT, padx=5)  # Every league at once
+
+        self.auto_refresh_var = tk.BooleanVar(value=False)
+        self.auto_refresh_check = ttk.Checkbutton(button_frame, text="Auto Refresh", variable=self.auto_refresh_var,
+                                                  command=self.schedule_refresh)
+        self.auto_refresh_check.pack(side=tk.LEFT, padx=5)  # Keep polling while games are on
+
         # Results frame - Display table of games
         results_frame = ttk.LabelFrame(main_frame, text="Game Results", padding="10")
         results_frame.pack(fill=tk.BOTH, expand=True, pady=5)
 
-        columns = ("away_team", "home_team", "away_score", "home_score", "status", "date", "time")
+        columns = ("league", "away_team", "home_team", "away_score", "home_score", "status", "date", "time")
         self.results_tree = ttk.Treeview(results_frame, columns=columns, show="headings", height=15)
         self.results_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
@@ -381,16 +500,60 @@ class ScoreApp:
         self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.results_tree.configure(yscrollcommand=self.scrollbar.set)
 
+    # Sort key that orders numbers (scores) numerically and puts text after them
+    @staticmethod
+    def _sort_key(value):
+        try:
+            return (0, float(value))
+        except (ValueError, TypeError):
+            return (1, value)
+
     # Method to sort the table
     def sort_treeview(self, col, reverse):
-        data = [(self.results_tree.set(child, col), child) for child in self.results_tree.get_children('')]
+        data = [(self._sort_key(self.results_tree.set(child, col)), child) for child in self.results_tree.get_children('')]
         data.sort(reverse=reverse)
         for index, (val, child) in enumerate(data):
             self.results_tree.move(child, '', index)
         self.results_tree.heading(col, command=lambda: self.sort_treeview(col, not reverse))
 
+    # Runs func(*args) on a worker thread, then hands the result to callback back on the Tk main thread
+    # With a channel, only the newest request on that channel gets its callback - older ones are superseded
+    def run_in_background(self, func, args, callback, *callback_args, channel=None):
+        self._request_count += 1
+        request_id = self._request_count
+        if channel is not None:
+            self._latest_request[channel] = request_id
+
+        future = self.executor.submit(func, *args)
+        future.add_done_callback(lambda f: self._finished.put((f, channel, request_id, callback, callback_args)))
+
+    # Runs on the Tk thread - hands every finished background job to its callback, then checks again shortly
+    def _poll_results(self):
+        try:
+            while True:
+                future, channel, request_id, callback, callback_args = self._finished.get_nowait()
+
+                # A newer request on the same channel was made - this result is out of date
+                if channel is not None and self._latest_request.get(channel) != request_id:
+                    continue
+
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logging.error(f"Background task failed: {e}")
+                    messagebox.showerror("Unexpected Error", f"An unexpected error occurred: {e}")
+                    continue
+
+                callback(result, *callback_args)
+        except queue.Empty:
+            pass
+        finally:
+            self.master.after(self.poll_interval_ms, self._poll_results)
+
     # Fetch scores and displays them in the table
-    def fetch_and_display(self):
+    # auto is True when the auto refresh timer calls this - then no pop-ups, just the table update
+    def fetch_and_display(self, auto=False):
+        self._refresh_command = self.fetch_and_display
         league = self.league_var.get()
         date_str = self.date_var.get()
         try:
@@ -398,47 +561,112 @@ class ScoreApp:
             date_obj = datetime.strptime(date_str, "%Y-%m-%d")
             date_str_api = date_obj.strftime("%Y%m%d")
         except ValueError:
-            messagebox.showerror("Error", "Invalid date format. Please use YYYY-MM-DD.")
+            if auto:
+                logging.warning(f"Auto refresh skipped - invalid date {date_str!r}")
+                self.schedule_refresh(keep_interval=True)
+            else:
+                messagebox.showerror("Error", "Invalid date format. Please use YYYY-MM-DD.")
             return
 
         filter_option = self.filter_var.get()
 
-        # Fetch the scores
-        result = self.fetcher.get_scores(league, date_str_api)
+        # Fetch the scores in the background - display_scores picks up the result
+        self.run_in_background(self.fetcher.get_scores, (league, date_str_api), self.display_scores,
+                               filter_option, league.lower(), auto, channel="scores")
 
-        # Clear out the old table data
-        for item in self.results_tree.get_children():
-            self.results_tree.delete(item)
+    # Fetch scores for every league and displays them in the table (auto works like in fetch_and_display)
+    def fetch_all_and_display(self, auto=False):
+        self._refresh_command = self.fetch_all_and_display
+        date_str = self.date_var.get()
+        try:
+            # Parse the date
+            date_obj = datetime.strptime(date_str, "%Y-%m-%d")
+            date_str_api = date_obj.strftime("%Y%m%d")
+        except ValueError:
+            if auto:
+                logging.warning(f"Auto refresh skipped - invalid date {date_str!r}")
+                self.schedule_refresh(keep_interval=True)
+            else:
+                messagebox.showerror("Error", "Invalid date format. Please use YYYY-MM-DD.")
+            return
+
+        filter_option = self.filter_var.get()
+
+        # Fetch all the leagues in the background - display_all_scores picks up the result
+        self.run_in_background(self.fetcher.get_all_scores, (date_str_api,), self.display_all_scores, filter_option,
+                               auto, channel="scores")
+
+    # The (league, game_id) of the game picked in the dropdown, or None
+    def selected_game_key(self):
+        return getattr(self.game_combo, 'game_ids', {}).get(self.game_var.get())
+
+    # Re-selects the game with this (league, game_id) if it's still in the dropdown
+    def restore_selection(self, game_key):
+        if game_key is None:
+            return
+        for game_str, key in self.game_combo.game_ids.items():
+            if key == game_key:
+                self.game_var.set(game_str)
+                return
+
+    # Clears out the old table data and game dropdown
+    def clear_results(self):
+        self.results_tree.delete(*self.results_tree.get_children())
 
         self.game_combo['values'] = []  # Clear the game
         self.game_var.set("")
 
+    # Populates the table and game dropdown from {league: games}, returns how many games were shown
+    def populate_results(self, games_by_league, filter_option):
+        game_options = []
+
+        # Take the table off screen while filling it so Tk doesn't redraw after every row
+        self.results_tree.pack_forget()
+        try:
+            for league, games in games_by_league.items():
+                for game in games:
+                    # Apply the filter if it's not "All"
+                    if filter_option != "All" and game.status != filter_option:
+                        continue
+
+                    game_str = f"{game.away_team} @ {game.home_team} ({game.date} {game.time})"
+                    game_options.append((game_str, (league, game.game_id)))
+                    self.results_tree.insert("", "end", values=(
+                        league,
+                        game.away_team,
+                        game.home_team,
+                        game.away_score,
+                        game.home_score,
+                        game.status,
+                        game.date,
+                        game.time
+                    ))
+        finally:
+            self.results_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, before=self.scrollbar)
+
+        self.game_combo['values'] = [option[0] for option in game_options]
+        self.game_combo.game_ids = {option[0]: option[1] for option in game_options}
+        return len(game_options)
+
+    # Fills the table and game dropdown with the fetched scores
+    # Keeps the selected game if it's still there; auto refreshes log problems instead of popping up dialogs
+    def display_scores(self, result, filter_option, league, auto=False):
+        # A failed (or empty, which is how network errors come back) auto refresh leaves the table
+        # alone and tries again at the same pace
+        if auto and not (isinstance(result, list) and result):
+            logging.warning(f"Auto refresh failed or came back empty, keeping the current scores: {result}")
+            self.schedule_refresh(keep_interval=True)
+            return
+
+        selected_key = self.selected_game_key()
+        self.clear_results()
+
         # Check to see if we have a list of games
         if isinstance(result, list):
             if result:
-                # Apply the filter if it's not "All"
-                filtered_games = result
-                if filter_option != "All":
-                    filtered_games = [game for game in result if game['status'] == filter_option]
-
-                if filtered_games:
-                    game_options = []
-                    # Populate the table and game dropdown with the filtered games
-                    for game in filtered_games:
-                        game_str = f"{game['away_team']} @ {game['home_team']} ({game['date']} {game['time']})"
-                        game_options.append((game_str, game['game_id']))
-                        self.results_tree.insert("", "end", values=(
-                            game['away_team'],
-                            game['home_team'],
-                            game['away_score'],
-                            game['home_score'],
-                            game['status'],
-                            game['date'],
-                            game['time']
-                        ))
-                    self.game_combo['values'] = [option[0] for option in game_options]
-                    self.game_combo.game_ids = {option[0]: option[1] for option in game_options}
-                else:
+                if self.populate_results({league: result}, filter_option):
+                    self.restore_selection(selected_key)
+                elif not auto:
                     messagebox.showinfo("Info", f"No {filter_option.lower()} games found for the selected league and date.")
             else:
                 messagebox.showinfo("Info", "No games found for the selected league and date.")
@@ -453,6 +681,67 @@ class ScoreApp:
             elif result[0] == "unexpected_error":
                 messagebox.showerror("Unexpected Error", f"An unexpected error occurred: {result[1]}")
 
+        games_by_league = {league: result} if isinstance(result, list) else {}
+        self.schedule_refresh(self._refresh_statuses(games_by_league, filter_option))
+
+    # Fills the table and game dropdown with the scores from every league (selection and auto as in display_scores)
+    def display_all_scores(self, results, filter_option, auto=False):
+        # Every league empty on an auto refresh most likely means the fetches failed - keep the table
+        if auto and not any(results.values()):
+            logging.warning("Auto refresh came back empty for every league, keeping the current scores")
+            self.schedule_refresh(keep_interval=True)
+            return
+
+        selected_key = self.selected_game_key()
+        self.clear_results()
+
+        if self.populate_results(results, filter_option):
+            self.restore_selection(selected_key)
+        elif not auto:
+            if not any(results.values()):
+                messagebox.showinfo("Info", "No games found in any league for the selected date.")
+            else:
+                messagebox.showinfo("Info", f"No {filter_option.lower()} games found in any league for the selected date.")
+
+        self.schedule_refresh(self._refresh_statuses(results, filter_option))
+
+    # Statuses that decide the next auto refresh - the filtered games, or all of them if the filter
+    # matched nothing (e.g. "Live" games that have all gone Scheduled -> Live -> Final)
+    @staticmethod
+    def _refresh_statuses(games_by_league, filter_option):
+        statuses = [game.status for games in games_by_league.values() for game in games]
+        shown = [status for status in statuses if filter_option == "All" or status == filter_option]
+        return shown or statuses
+
+    # How long to wait before the next auto refresh, based on the given statuses (or the games in the table)
+    # Live games every 15 seconds, scheduled ones every 5 minutes, and stop once everything is final
+    def _next_interval_ms(self, statuses=None):
+        if statuses is None:
+            statuses = [self.results_tree.set(child, "status") for child in self.results_tree.get_children()]
+        if "Live" in statuses:
+            return 15 * 1000
+        if "Scheduled" in statuses:
+            return 5 * 60 * 1000
+        return None
+
+    # (Re)schedules the next auto refresh, or cancels it if auto refresh is off or nothing needs polling
+    # keep_interval reuses the last interval - for auto refreshes that failed and have nothing new to go on
+    def schedule_refresh(self, statuses=None, keep_interval=False):
+        if self._refresh_job is not None:
+            self.master.after_cancel(self._refresh_job)
+            self._refresh_job = None
+
+        if not self.auto_refresh_var.get() or self._refresh_command is None:
+            return
+
+        if keep_interval and self._last_interval_ms is not None:
+            interval = self._last_interval_ms
+        else:
+            interval = self._next_interval_ms(statuses)
+        self._last_interval_ms = interval
+        if interval is not None:
+            self._refresh_job = self.master.after(interval, self._refresh_command, True)
+
     # Method that shows the box score in a new window
     def view_box_score(self):
         selected_game = self.game_var.get()
@@ -460,19 +749,23 @@ class ScoreApp:
             messagebox.showwarning("Warning", "Please select a game to view the box score.")
             return
 
-        game_id = self.game_combo.game_ids.get(selected_game)
+        league, game_id = self.game_combo.game_ids.get(selected_game, (None, None))
         if not game_id:
             messagebox.showerror("Error", "Invalid game selection.")
             return
 
-        league = self.league_var.get()
+        # Use the league the game came from - with "Fetch All" it may not be the selected one
         league_url_part = self.fetcher.league_paths.get(league)
         if not league_url_part:
             messagebox.showerror("Error", "Unable to determine league URL part.")
             return
 
-        # Fetch the box score
-        box_score = self.fetcher.get_game_box_score(league_url_part, game_id)
+        # Fetch the box score in the background - show_box_score builds the window once it arrives
+        self.run_in_background(self.fetcher.get_game_box_score, (league_url_part, game_id),
+                               self.show_box_score, selected_game)
+
+    # Builds the box score window
+    def show_box_score(self, box_score, selected_game):
         if isinstance(box_score, tuple):
             if box_score[0] == "network_error":
                 messagebox.showerror("Network Error", f"Failed to fetch box score: {box_score[1]}")
@@ -496,44 +789,24 @@ class ScoreApp:
             team_label = ttk.Label(team_frame, text=f"{team['name']} ({team['homeAway']}): {team['score']}")
             team_label.pack(anchor="w")
 
-        # Team stats
+        # Team stats - each tab is only built when it's first shown (see _populate_tab)
         team_stats_frame = ttk.LabelFrame(box_score_frame, text="Team Statistics", padding="10")
         team_stats_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         team_stats_notebook = ttk.Notebook(team_stats_frame)
         team_stats_notebook.pack(fill=tk.BOTH, expand=True)
+        team_stats_notebook.bind("<<NotebookTabChanged>>", self._populate_tab)
 
         for team_name, stats in box_score['team_stats'].items():
             team_tab = ttk.Frame(team_stats_notebook)
+            team_tab.pending = partial(self.fill_team_stats_tab, team_tab, stats)
             team_stats_notebook.add(team_tab, text=team_name)
-            
-            stats_container = ttk.Frame(team_tab)
-            stats_container.pack(fill=tk.BOTH, expand=True)
-            
-            # Use a Treeview to display stats
-            stats_tree = ttk.Treeview(stats_container, columns=("stat", "value"), show="headings")
-            stats_tree.heading("stat", text="Statistic")
-            stats_tree.heading("value", text="Value")
-            stats_tree.column("stat", width=200, anchor="w")  
-            stats_tree.column("value", width=150, anchor="center")
-            
-            # Add scrollbars in case of a lot of stats
-            v_scrollbar = ttk.Scrollbar(stats_container, orient="vertical", command=stats_tree.yview)
-            v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-            stats_tree.configure(yscrollcommand=v_scrollbar.set)
-            
-            h_scrollbar = ttk.Scrollbar(stats_container, orient="horizontal", command=stats_tree.xview)
-            h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
-            stats_tree.configure(xscrollcommand=h_scrollbar.set)
-            
-            stats_tree.pack(fill=tk.BOTH, expand=True)
-            for stat in stats:
-                stats_tree.insert("", "end", values=(stat['name'], stat['displayValue']))
 
-        # Player stats
+        # Player stats - built lazily the same way
         player_stats_frame = ttk.LabelFrame(box_score_frame, text="Player Statistics", padding="10")
         player_stats_frame.pack(fill=tk.BOTH, expand=True, pady=5)
         player_stats_notebook = ttk.Notebook(player_stats_frame)
         player_stats_notebook.pack(fill=tk.BOTH, expand=True)
+        player_stats_notebook.bind("<<NotebookTabChanged>>", self._populate_tab)
 
         for team_name, stat_categories in box_score['player_stats'].items():
             if not stat_categories:
@@ -544,61 +817,82 @@ class ScoreApp:
             for stat_category in stat_categories:
                 category_name = stat_category.get('name', 'General')
                 team_tab = ttk.Frame(player_stats_notebook)
-                player_stats_notebook.add(team_tab, text=f"{team_name} - {category_name}")
 
                 athletes = stat_category.get('athletes', [])
+                stats_list = athletes[0].get('stats', []) if athletes else []
                 if not athletes:
                     ttk.Label(team_tab, text="No player stats available for this category").pack()
-                    continue
-
-                first_athlete = athletes[0]
-                stats_list = first_athlete.get('stats', [])
-                
-                if not stats_list:
+                elif not stats_list:
                     ttk.Label(team_tab, text="No detailed stats available").pack()
-                    continue
-                
-                stats_container = ttk.Frame(team_tab)
-                stats_container.pack(fill=tk.BOTH, expand=True)
-                
-                # Player stats to check if the stats are dictionaries, or lists
-                if isinstance(stats_list[0], dict):
-                    columns = ("player",) + tuple(stat.get('name', 'Unknown') for stat in stats_list)
-                    stats_tree = ttk.Treeview(stats_container, columns=columns, show="headings")
-                    stats_tree.heading("player", text="Player")
-                    stats_tree.column("player", width=200, anchor="w")
-                    for stat in stats_list:
-                        stat_name = stat.get('name', 'Unknown')
-                        stats_tree.heading(stat_name, text=stat_name)
-                        stats_tree.column(stat_name, width=100, anchor="center")
                 else:
-                    columns = ("player",) + tuple(f"Stat_{i+1}" for i in range(len(stats_list)))
-                    stats_tree = ttk.Treeview(stats_container, columns=columns, show="headings")
-                    stats_tree.heading("player", text="Player")
-                    stats_tree.column("player", width=200, anchor="w")
-                    for i, col in enumerate(columns[1:], 1):
-                        stats_tree.heading(col, text=f"Stat {i}")
-                        stats_tree.column(col, width=100, anchor="center")
-
-                # Add scrollbars
-                v_scrollbar = ttk.Scrollbar(stats_container, orient="vertical", command=stats_tree.yview)
-                v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
-                stats_tree.configure(yscrollcommand=v_scrollbar.set)
-                
-                h_scrollbar = ttk.Scrollbar(stats_container, orient="horizontal", command=stats_tree.xview)
-                h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
-                stats_tree.configure(xscrollcommand=h_scrollbar.set)
-                
-                stats_tree.pack(fill=tk.BOTH, expand=True)
-
-                # Add each player's stats to the table
-                for athlete in athletes:
-                    stats = athlete.get('stats', [])
-                    if isinstance(stats, list) and stats and isinstance(stats[0], dict):
-                        values = (athlete['athlete']['displayName'],) + tuple(stat.get('displayValue', 'N/A') for stat in stats)
-                    else:
-                        values = (athlete['athlete']['displayName'],) + tuple(stats if stats else ['N/A'] * (len(columns) - 1))
-                    stats_tree.insert("", "end", values=values)
+                    team_tab.pending = partial(self.fill_player_stats_tab, team_tab, stats_list, athletes)
+
+                player_stats_notebook.add(team_tab, text=f"{team_name} - {category_name}")
+
+    # Builds a notebook tab's contents the first time it's shown
+    def _populate_tab(self, event):
+        notebook = event.widget
+        if not notebook.select():
+            return
+        tab = notebook.nametowidget(notebook.select())
+        pending = getattr(tab, 'pending', None)
+        if pending is not None:
+            del tab.pending
+            pending()
+
+    # Fills a team stats tab with a table of that team's stats
+    def fill_team_stats_tab(self, team_tab, stats):
+        rows = ((stat['name'], stat['displayValue']) for stat in stats)
+        self._build_stats_tree(team_tab, self.TEAM_STATS_COLUMNS, rows, widths=self.TEAM_STATS_WIDTHS)
+
+    # Fills a player stats tab with one row per athlete for that stat category
+    def fill_player_stats_tab(self, team_tab, stats_list, athletes):
+        # Player stats to check if the stats are dictionaries, or lists
+        if isinstance(stats_list[0], dict):
+            stat_columns = [(name, name) for name in (stat.get('name', 'Unknown') for stat in stats_list)]
+        else:
+            stat_columns = [(f"Stat_{i}", f"Stat {i}") for i in range(1, len(stats_list) + 1)]
+        columns = [("player", "Player")] + stat_columns
+
+        # One row per player
+        rows = []
+        for athlete in athletes:
+            stats = athlete.get('stats', [])
+            if isinstance(stats, list) and stats and isinstance(stats[0], dict):
+                values = (athlete['athlete']['displayName'],) + tuple(stat.get('displayValue', 'N/A') for stat in stats)
+            else:
+                values = (athlete['athlete']['displayName'],) + tuple(stats if stats else ['N/A'] * len(stat_columns))
+            rows.append(values)
+
+        self._build_stats_tree(team_tab, columns, rows)
+
+    # Builds a scrollable stats table in parent and fills it with rows
+    # columns is a list of (column id, heading) pairs - the first column is left-aligned, the rest centered
+    # widths defaults to 200 for the first column and 100 for the others
+    def _build_stats_tree(self, parent, columns, rows, widths=None):
+        if widths is None:
+            widths = (200,) + (100,) * (len(columns) - 1)
+
+        container = ttk.Frame(parent)
+        container.pack(fill=tk.BOTH, expand=True)
+
+        tree = ttk.Treeview(container, columns=[column_id for column_id, _ in columns], show="headings")
+        for index, ((column_id, heading), width) in enumerate(zip(columns, widths)):
+            tree.heading(column_id, text=heading)
+            tree.column(column_id, width=width, anchor="w" if index == 0 else "center")
+
+        # Add scrollbars in case of a lot of stats
+        v_scrollbar = ttk.Scrollbar(container, orient="vertical", command=tree.yview)
+        v_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        h_scrollbar = ttk.Scrollbar(container, orient="horizontal", command=tree.xview)
+        h_scrollbar.pack(side=tk.BOTTOM, fill=tk.X)
+        tree.configure(yscrollcommand=v_scrollbar.set, xscrollcommand=h_scrollbar.set)
+
+        # Fill the table before packing it so it's drawn once
+        for values in rows:
+            tree.insert("", "end", values=values)
+        tree.pack(fill=tk.BOTH, expand=True)
+        return tree
 
 if __name__ == "__main__":
     root = tk.Tk()